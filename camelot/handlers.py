@@ -1,6 +1,12 @@
+import gc
+import heapq
+import io
+import mmap
 import multiprocessing as mp
 import os
 import sys
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
 from typing import Union
 
@@ -15,10 +21,51 @@ from .utils import TemporaryDirectory
 from .utils import download_url
 from .utils import get_page_layout
 from .utils import get_rotation
-from .utils import get_text_objects
+from .utils import get_text_objects_multi
 from .utils import is_url
 
 
+# PDFs up to this size are read into memory once, so that pypdf's
+# random-access seeks don't go through to a slow file or stream. Larger
+# files are memory-mapped instead.
+MAX_IN_MEMORY_SIZE = 128 * 1024 * 1024
+
+# Page entries that don't affect table extraction and are left out when
+# splitting pages. Article beads (/B) link to other pages, so cloning
+# them copies much of the document into every single page PDF.
+EXCLUDED_PAGE_KEYS = ("/B",)
+
+PARSERS = {
+    "lattice": Lattice,
+    "stream": Stream,
+}
+
+# Maximum number of pages a worker process parses before it is replaced
+# by a fresh one, which bounds the memory held by long-running workers.
+MAX_PAGES_PER_CHILD = 32
+
+# Handler and parser of a worker process, set once by _init_worker so
+# they aren't pickled along with every page.
+_worker_handler = None
+_worker_parser = None
+
+
+def _init_worker(handler, parser):
+    global _worker_handler, _worker_parser
+    _worker_handler = handler
+    _worker_parser = parser
+
+
+def _parse_page_worker(args):
+    page, page_bytes, tempdir, suppress_stdout, layout_kwargs = args
+    tables = _worker_handler._parse_page(
+        page, page_bytes, tempdir, _worker_parser, suppress_stdout, layout_kwargs
+    )
+    # release the page's pdfminer layout before the next task
+    gc.collect()
+    return tables
+
+
 class PDFHandler:
     """Handles all operations like temp directory creation, splitting
     file into single page PDFs, parsing each PDF and then removing the
@@ -50,8 +97,63 @@ class PDFHandler:
             self.password = password
             if sys.version_info[0] < 3:
                 self.password = self.password.encode("ascii")
+        self._cached_bytes = None
         self.pages = self._get_pages(pages)
 
+    def __getstate__(self):
+        # parallel workers only read the split pages, so don't ship
+        # the source PDF, its in-memory copy or its reader to them
+        state = self.__dict__.copy()
+        if not isinstance(self.filepath, (str, Path)):
+            state["filepath"] = None
+        state["_cached_bytes"] = None
+        state.pop("_reader", None)
+        return state
+
+    @contextmanager
+    def managed_file_context(self):
+        """Opens the PDF for reading, buffering it in memory.
+
+        Streams are always read into memory. Files are read into memory
+        unless they are larger than ``MAX_IN_MEMORY_SIZE``. The bytes read
+        are cached, so subsequent calls don't read the PDF again.
+
+        Larger files are memory-mapped instead, and each call maps the
+        file anew. Nothing is cached for them; the mapping is released
+        when the objects reading from it (e.g. the cached reader) are.
+
+        Yields
+        ------
+        f : file-like
+            Binary file-like object positioned at the start of the PDF.
+
+        """
+        if self._cached_bytes is None:
+            if isinstance(self.filepath, (str, Path)):
+                if os.path.getsize(self.filepath) > MAX_IN_MEMORY_SIZE:
+                    # the mapping stays valid after the file is closed
+                    with open(self.filepath, "rb") as f:
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    yield mm
+                    return
+                with open(self.filepath, "rb") as f:
+                    self._cached_bytes = f.read()
+            else:
+                # pipes and sockets can't seek, read them from where they are
+                if self.filepath.seekable():
+                    self.filepath.seek(0)
+                self._cached_bytes = self.filepath.read()
+        yield io.BytesIO(self._cached_bytes)
+
+    @cached_property
+    def _reader(self):
+        """Decrypted PdfReader for the PDF, built once and reused."""
+        with self.managed_file_context() as f:
+            infile = PdfReader(f, strict=False)
+            if infile.is_encrypted:
+                infile.decrypt(self.password)
+        return infile
+
     def _get_pages(self, pages):
         """Converts pages string to list of ints.
 
@@ -69,79 +171,88 @@ class PDFHandler:
             List of int page numbers.
 
         """
-        page_numbers = []
+        page_ranges = []
 
-        if pages == "1":
-            page_numbers.append({"start": 1, "end": 1})
+        # the PDF is only read when the page count is needed
+        if pages == "all":
+            page_ranges.append((1, len(self._reader.pages)))
         else:
-            infile = PdfReader(self.filepath, strict=False)
+            for r in pages.split(","):
+                if "-" in r:
+                    a, b = r.split("-")
+                    if b == "end":
+                        b = len(self._reader.pages)
+                    page_ranges.append((int(a), int(b)))
+                else:
+                    page_ranges.append((int(r), int(r)))
 
-            if infile.is_encrypted:
-                infile.decrypt(self.password)
+        return sorted({p for start, end in page_ranges for p in range(start, end + 1)})
 
-            if pages == "all":
-                page_numbers.append({"start": 1, "end": len(infile.pages)})
-            else:
-                for r in pages.split(","):
-                    if "-" in r:
-                        a, b = r.split("-")
-                        if b == "end":
-                            b = len(infile.pages)
-                        page_numbers.append({"start": int(a), "end": int(b)})
-                    else:
-                        page_numbers.append({"start": int(r), "end": int(r)})
-
-        result = []
-        for p in page_numbers:
-            result.extend(range(p["start"], p["end"] + 1))
-        return sorted(set(result))
-
-    def _save_page(self, filepath: Union[StrByteType, Path], page, temp):
-        """Saves specified page from PDF into a temporary directory.
+    def _split_page(self, page):
+        """Splits specified page from PDF into a single page PDF, reading
+        and decrypting the PDF only once for all pages.
 
         Parameters
         ----------
-        filepath : str
-            Filepath or URL of the PDF file.
         page : int
             Page number.
-        temp : str
-            Tmp directory.
+
+        Returns
+        -------
+        page_bytes : bytes
+            Single page PDF.
 
         """
-        infile = PdfReader(filepath, strict=False)
-        if infile.is_encrypted:
-            infile.decrypt(self.password)
-        fpath = os.path.join(temp, f"page-{page}.pdf")
-        froot, fext = os.path.splitext(fpath)
-        p = infile.pages[page - 1]
         outfile = PdfWriter()
-        outfile.add_page(p)
-        with open(fpath, "wb") as f:
-            outfile.write(f)
-        layout, dim = get_page_layout(fpath)
-        # fix rotated PDF
-        chars = get_text_objects(layout, ltype="char")
-        horizontal_text = get_text_objects(layout, ltype="horizontal_text")
-        vertical_text = get_text_objects(layout, ltype="vertical_text")
+        # add_page clones the page, so the cached reader's page objects
+        # are never mutated
+        outfile.add_page(
+            self._reader.pages[page - 1], excluded_keys=EXCLUDED_PAGE_KEYS
+        )
+        f = io.BytesIO()
+        outfile.write(f)
+        return f.getvalue()
+
+    def _fix_rotation(self, page_bytes, layout):
+        """Rotates a single page PDF if its text is rotated.
+
+        Parameters
+        ----------
+        page_bytes : bytes
+            Single page PDF.
+        layout : object
+            PDFMiner LTPage object of the page.
+
+        Returns
+        -------
+        page_bytes : bytes
+            Single page PDF, rotated so that its text is upright.
+
+        """
+        # The page's /Rotate entry can't stand in for this check: pdfminer
+        # already applies it, so pages with /Rotate set are usually upright,
+        # while text drawn sideways on an unrotated page is not reflected
+        # in /Rotate at all.
+        objs = get_text_objects_multi(
+            layout, ltypes=("char", "horizontal_text", "vertical_text")
+        )
+        chars = objs["char"]
+        horizontal_text = objs["horizontal_text"]
+        vertical_text = objs["vertical_text"]
         rotation = get_rotation(chars, horizontal_text, vertical_text)
-        if rotation != "":
-            fpath_new = "".join([froot.replace("page", "p"), "_rotated", fext])
-            os.rename(fpath, fpath_new)
-            instream = open(fpath_new, "rb")
-            infile = PdfReader(instream, strict=False)
-            if infile.is_encrypted:
-                infile.decrypt(self.password)
-            outfile = PdfWriter()
-            p = infile.pages[0]
-            if rotation == "anticlockwise":
-                p.rotate(90)
-            elif rotation == "clockwise":
-                p.rotate(-90)
-            outfile.add_page(p)
-            with open(fpath, "wb") as f:
-                outfile.write(f)
-            instream.close()
+        if rotation == "":
+            return page_bytes
+        infile = PdfReader(io.BytesIO(page_bytes), strict=False)
+        outfile = PdfWriter()
+        p = infile.pages[0]
+        if rotation == "anticlockwise":
+            p.rotate(90)
+        elif rotation == "clockwise":
+            p.rotate(-90)
+        outfile.add_page(p)
+        f = io.BytesIO()
+        outfile.write(f)
+        return f.getvalue()
 
     def parse(
         self,
@@ -178,33 +289,77 @@ class PDFHandler:
         if layout_kwargs is None:
             layout_kwargs = {}
 
-        tables = []
-        parser = Lattice(**kwargs) if flavor == "lattice" else Stream(**kwargs)
+        page_tables = []
+        parser = PARSERS[flavor](**kwargs)
         with TemporaryDirectory() as tempdir:
             cpu_count = mp.cpu_count()
             # Using multiprocessing only when cpu_count > 1 to prevent a stallness issue
             # when cpu_count is 1
             if parallel and len(self.pages) > 1 and cpu_count > 1:
-                with mp.get_context("spawn").Pool(processes=cpu_count) as pool:
-                    jobs = []
-                    for p in self.pages:
-                        j = pool.apply_async(
-                            self._parse_page,(p, tempdir, parser, suppress_stdout, layout_kwargs)
+                # On Linux, forked workers inherit the handler and parser
+                # instead of re-importing camelot and unpickling them
+                use_fork = sys.platform.startswith("linux")
+                ctx = mp.get_context("fork" if use_fork else "spawn")
+                # Move existing objects out of the gc's reach so that
+                # collections in the workers don't touch (and copy) the
+                # memory pages shared with the parent. Leave the gc alone
+                # if anything is frozen already, since unfreezing would
+                # also undo the caller's (or another thread's) freeze.
+                freeze_gc = use_fork and gc.get_freeze_count() == 0
+                if freeze_gc:
+                    gc.collect()
+                    gc.freeze()
+                try:
+                    chunksize = min(
+                        MAX_PAGES_PER_CHILD, len(self.pages) // (4 * cpu_count)
+                    )
+                    chunksize = max(1, chunksize)
+                    # a pool task is a whole chunk of pages
+                    maxtasksperchild = max(1, MAX_PAGES_PER_CHILD // chunksize)
+                    with ctx.Pool(
+                        processes=cpu_count,
+                        maxtasksperchild=maxtasksperchild,
+                        initializer=_init_worker,
+                        initargs=(self, parser),
+                    ) as pool:
+                        # pages are split as the pool consumes the jobs,
+                        # so they aren't all held in memory at once
+                        jobs = (
+                            (
+                                p,
+                                self._split_page(p),
+                                tempdir,
+                                suppress_stdout,
+                                layout_kwargs,
+                            )
+                            for p in self.pages
                         )
-                        jobs.append(j)
-
-                    for j in jobs:
-                        t = j.get()
-                        tables.extend(t)
+                        # collect tables as pages finish, in any order,
+                        # so one slow page doesn't hold up the rest
+                        for t in pool.imap_unordered(
+                            _parse_page_worker, jobs, chunksize=chunksize
+                        ):
+                            page_tables.append(t)
+                finally:
+                    if freeze_gc:
+                        gc.unfreeze()
             else:
                 for p in self.pages:
-                    t = self._parse_page(p, tempdir, parser, suppress_stdout, layout_kwargs)
-                    tables.extend(t)
+                    t = self._parse_page(
+                        p,
+                        self._split_page(p),
+                        tempdir,
+                        parser,
+                        suppress_stdout,
+                        layout_kwargs,
+                    )
+                    page_tables.append(t)
 
-        return TableList(sorted(tables))
+        # each page's tables are already sorted
+        return TableList(list(heapq.merge(*page_tables)))
 
     def _parse_page(
-        self, page, tempdir, parser, suppress_stdout, layout_kwargs
+        self, page, page_bytes, tempdir, parser, suppress_stdout, layout_kwargs
     ):
         """Extracts tables by calling parser.get_tables on a single
         page PDF.
@@ -213,6 +368,10 @@ class PDFHandler:
         ----------
         page : str
             Page number to parse
+        page_bytes : bytes
+            Single page PDF of the page.
+        tempdir : str
+            Tmp directory.
         parser : Lattice or Stream
             The parser to use (Lattice or Stream).
         suppress_stdout : bool
@@ -222,13 +381,29 @@ class PDFHandler:
 
         Returns
         -------
-        tables : camelot.core.TableList
-            List of tables found in PDF.
-        
+        tables : list
+            Sorted list of tables found on the page.
+
         """
-        self._save_page(self.filepath, page, tempdir)
+        layout, dimensions = None, None
+        # fix rotated PDF
+        if parser.needs_rotation_fix:
+            page_layout = get_page_layout(io.BytesIO(page_bytes))
+            fixed_bytes = self._fix_rotation(page_bytes, page_layout[0])
+            # the parser can reuse this layout, unless the page was
+            # rotated or it asks for different LAParams
+            if fixed_bytes is page_bytes and not layout_kwargs:
+                layout, dimensions = page_layout
+            page_bytes = fixed_bytes
+        # the parsers and image conversion backends need the page on disk
         page_path = os.path.join(tempdir, f"page-{page}.pdf")
+        with open(page_path, "wb") as f:
+            f.write(page_bytes)
         tables = parser.extract_tables(
-            page_path, suppress_stdout=suppress_stdout, layout_kwargs=layout_kwargs
+            page_path,
+            suppress_stdout=suppress_stdout,
+            layout_kwargs=layout_kwargs,
+            layout=layout,
+            dimensions=dimensions,
         )
-        return tables
+        return sorted(tables)
@@ -4,6 +4,7 @@ from typing import Union
 
 from pypdf._utils import StrByteType
 
+from .handlers import PARSERS
 from .handlers import PDFHandler
 from .utils import remove_extra
 from .utils import validate_input
@@ -110,10 +111,9 @@ def read_pdf(
     """
     if layout_kwargs is None:
         layout_kwargs = {}
-    if flavor not in ["lattice", "stream"]:
-        raise NotImplementedError(
-            "Unknown flavor specified." " Use either 'lattice' or 'stream'"
-        )
+    if flavor not in PARSERS:
+        flavors = " or ".join(f"'{f}'" for f in PARSERS)
+        raise NotImplementedError(f"Unknown flavor specified. Use either {flavors}")
 
     with warnings.catch_warnings():
         if suppress_stdout:
@@ -1,19 +1,29 @@
 import os
 
 from ..utils import get_page_layout
-from ..utils import get_text_objects
+from ..utils import get_text_objects_multi
 
 
 class BaseParser:
     """Defines a base parser."""
 
-    def _generate_layout(self, filename, layout_kwargs):
+    # Whether pages with sideways text should be rotated upright before
+    # they are parsed. Parsers that handle rotated text themselves can
+    # set this to False to skip the extra pdfminer pass per page.
+    needs_rotation_fix = True
+
+    def _generate_layout(self, filename, layout_kwargs, layout=None, dimensions=None):
         self.filename = filename
         self.layout_kwargs = layout_kwargs
-        self.layout, self.dimensions = get_page_layout(filename, **layout_kwargs)
-        self.images = get_text_objects(self.layout, ltype="image")
-        self.horizontal_text = get_text_objects(self.layout, ltype="horizontal_text")
-        self.vertical_text = get_text_objects(self.layout, ltype="vertical_text")
+        if layout is None:
+            layout, dimensions = get_page_layout(filename, **layout_kwargs)
+        self.layout, self.dimensions = layout, dimensions
+        objs = get_text_objects_multi(
+            self.layout, ltypes=("image", "horizontal_text", "vertical_text")
+        )
+        self.images = objs["image"]
+        self.horizontal_text = objs["horizontal_text"]
+        self.vertical_text = objs["vertical_text"]
         self.pdf_width, self.pdf_height = self.dimensions
         self.rootname, __ = os.path.splitext(self.filename)
         self.imagename = "".join([self.rootname, ".png"])
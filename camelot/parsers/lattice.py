@@ -395,8 +395,15 @@ class Lattice(BaseParser):
 
         return table
 
-    def extract_tables(self, filename, suppress_stdout=False, layout_kwargs={}):
-        self._generate_layout(filename, layout_kwargs)
+    def extract_tables(
+        self,
+        filename,
+        suppress_stdout=False,
+        layout_kwargs={},
+        layout=None,
+        dimensions=None,
+    ):
+        self._generate_layout(filename, layout_kwargs, layout, dimensions)
         if not suppress_stdout:
             logger.info(f"Processing {os.path.basename(self.rootname)}")
 
@@ -443,8 +443,15 @@ class Stream(BaseParser):
 
         return table
 
-    def extract_tables(self, filename, suppress_stdout=False, layout_kwargs={}):
-        self._generate_layout(filename, layout_kwargs)
+    def extract_tables(
+        self,
+        filename,
+        suppress_stdout=False,
+        layout_kwargs={},
+        layout=None,
+        dimensions=None,
+    ):
+        self._generate_layout(filename, layout_kwargs, layout, dimensions)
         base_filename = os.path.basename(self.rootname)
 
         if not suppress_stdout:
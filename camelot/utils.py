@@ -5,6 +5,7 @@ import shutil
 import string
 import tempfile
 import warnings
+from contextlib import nullcontext
 from itertools import groupby
 from operator import itemgetter
 from urllib.parse import urlparse as parse_url
@@ -85,7 +86,8 @@ def download_url(url):
         content_type = obj.info().get_content_type()
         if content_type != "application/pdf":
             raise NotImplementedError("File format not supported")
-        f.write(obj.read())
+        # stream the download to disk in large chunks
+        shutil.copyfileobj(obj, f, 1024 * 1024)
     filepath = os.path.join(os.path.dirname(f.name), filename)
     shutil.move(f.name, filepath)
     return filepath
@@ -851,8 +853,8 @@ def get_page_layout(
 
     Parameters
     ----------
-    filename : string
-        Path to pdf file.
+    filename : string or file-like
+        Path to pdf file, or binary file-like object of the pdf.
     line_overlap : float
     char_margin : float
     line_margin : float
@@ -869,7 +871,11 @@ def get_page_layout(
         Dimension of pdf page in the form (width, height).
 
     """
-    with open(filename, "rb") as f:
+    if hasattr(filename, "read"):
+        f_context = nullcontext(filename)
+    else:
+        f_context = open(filename, "rb")
+    with f_context as f:
         parser = PDFParser(f)
         document = PDFDocument(parser)
         if not document.is_extractable:
@@ -899,6 +905,14 @@ def get_page_layout(
         return layout, dim
 
 
+_LTYPE_OBJECTS = {
+    "char": LTChar,
+    "image": LTImage,
+    "horizontal_text": LTTextLineHorizontal,
+    "vertical_text": LTTextLineVertical,
+}
+
+
 def get_text_objects(layout, ltype="char", t=None):
     """Recursively parses pdf layout to get a list of
     PDFMiner text objects.
@@ -918,14 +932,7 @@ def get_text_objects(layout, ltype="char", t=None):
         List of PDFMiner text objects.
 
     """
-    if ltype == "char":
-        LTObject = LTChar
-    elif ltype == "image":
-        LTObject = LTImage
-    elif ltype == "horizontal_text":
-        LTObject = LTTextLineHorizontal
-    elif ltype == "vertical_text":
-        LTObject = LTTextLineVertical
+    LTObject = _LTYPE_OBJECTS[ltype]
     if t is None:
         t = []
     try:
@@ -937,3 +944,41 @@ def get_text_objects(layout, ltype="char", t=None):
     except AttributeError:
         pass
     return t
+
+
+def get_text_objects_multi(
+    layout, ltypes=("char", "horizontal_text", "vertical_text"), t=None
+):
+    """Recursively parses pdf layout to get lists of PDFMiner text
+    objects of several types in a single pass.
+
+    Parameters
+    ----------
+    layout : object
+        PDFMiner LTPage object.
+    ltypes : tuple
+        Types of objects to get, see get_text_objects.
+    t : dict
+
+    Returns
+    -------
+    t : dict
+        Dict mapping each type to a list of PDFMiner text objects,
+        same as get_text_objects would return for it.
+
+    """
+    if t is None:
+        t = {ltype: [] for ltype in ltypes}
+    try:
+        for obj in layout._objs:
+            remaining = ltypes
+            for ltype in ltypes:
+                if isinstance(obj, _LTYPE_OBJECTS[ltype]):
+                    t[ltype].append(obj)
+                    # like get_text_objects, don't look inside a match
+                    remaining = tuple(lt for lt in remaining if lt != ltype)
+            if remaining:
+                get_text_objects_multi(obj, ltypes=remaining, t=t)
+    except AttributeError:
+        pass
+    return t
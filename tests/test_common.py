@@ -1,14 +1,25 @@
+import gc
+import io
+import mmap
 import os
+import pickle
+import sys
+import threading
 from pathlib import Path
 
 import pandas as pd
+import pytest
 from pandas.testing import assert_frame_equal
+from pypdf import PdfReader
 
 import camelot
 from camelot.__version__ import generate_version
 from camelot.core import Table
 from camelot.core import TableList
+from camelot.handlers import PARSERS
 from camelot.io import PDFHandler
+from camelot.parsers import Stream
+from camelot.utils import get_page_layout
 
 from .conftest import skip_on_windows
 from .conftest import skip_pdftopng
@@ -188,3 +199,179 @@ def test_handler_with_pathlib(testdir):
     with open(filename, "rb") as f:
         handler = PDFHandler(f)
         assert handler._get_pages("1") == [1]
+
+
+def test_handler_managed_file_context(testdir):
+    filename = os.path.join(testdir, "foo.pdf")
+
+    handler = PDFHandler(filename, pages="all")
+    with open(filename, "rb") as f:
+        assert handler._cached_bytes == f.read()
+
+    with handler.managed_file_context() as f:
+        assert f.read(5) == b"%PDF-"
+
+
+def test_handler_fix_rotation(testdir):
+    # /Rotate is already applied by pdfminer, so the page is upright
+    filename = os.path.join(testdir, "tabula/rotated_page.pdf")
+    handler = PDFHandler(filename)
+    page_bytes = handler._split_page(1)
+    layout, dim = get_page_layout(io.BytesIO(page_bytes))
+    assert handler._fix_rotation(page_bytes, layout) is page_bytes
+
+    # text drawn sideways on the page is rotated upright
+    filename = os.path.join(testdir, "anticlockwise_table_2.pdf")
+    handler = PDFHandler(filename)
+    page_bytes = handler._split_page(1)
+    layout, dim = get_page_layout(io.BytesIO(page_bytes))
+    assert handler._fix_rotation(page_bytes, layout) is not page_bytes
+
+
+def test_handler_pages_without_reader(testdir):
+    filename = os.path.join(testdir, "foo.pdf")
+
+    handler = PDFHandler(filename, pages="1,3-5")
+    assert handler.pages == [1, 3, 4, 5]
+    assert "_reader" not in handler.__dict__
+
+    handler = PDFHandler(filename, pages="1-end")
+    assert handler.pages == [1]
+    assert "_reader" in handler.__dict__
+
+
+def test_handler_pickle_drops_source(testdir):
+    filename = os.path.join(testdir, "foo.pdf")
+
+    handler = PDFHandler(filename, pages="all")
+    assert handler._cached_bytes is not None
+    assert "_reader" in handler.__dict__
+
+    handler = pickle.loads(pickle.dumps(handler))
+    assert handler._cached_bytes is None
+    assert "_reader" not in handler.__dict__
+    assert handler.pages == [1]
+
+    # the unpickled handler can still split pages, as a worker would
+    page_bytes = handler._split_page(1)
+    assert PdfReader(io.BytesIO(page_bytes)).pages[0] is not None
+
+    with open(filename, "rb") as f:
+        data = f.read()
+    for stream in (io.BytesIO(data), open(filename, "rb")):
+        with stream:
+            handler = PDFHandler(stream, pages="all")
+            pickled = pickle.dumps(handler)
+        assert len(pickled) < len(data) // 10
+        handler = pickle.loads(pickled)
+        assert handler.filepath is None
+        assert handler.pages == [1]
+
+
+def test_handler_split_pages_decrypted(testdir):
+    filename = os.path.join(testdir, "health_protected.pdf")
+
+    handler = PDFHandler(filename, pages="all", password="userpass")
+    assert handler._reader.is_encrypted
+
+    reader = PdfReader(io.BytesIO(handler._split_page(1)))
+    assert not reader.is_encrypted
+
+
+def test_handler_no_pages(testdir):
+    filename = os.path.join(testdir, "foo.pdf")
+
+    handler = PDFHandler(filename, pages="3-2")
+    assert handler.pages == []
+
+    tables = camelot.read_pdf(filename, pages="3-2", flavor="stream")
+    assert tables.n == 0
+
+
+def test_handler_managed_file_context_mmap(testdir, monkeypatch):
+    monkeypatch.setattr("camelot.handlers.MAX_IN_MEMORY_SIZE", 0)
+    filename = os.path.join(testdir, "health_protected.pdf")
+
+    handler = PDFHandler(filename, pages="all", password="userpass")
+    assert handler._cached_bytes is None
+    with handler.managed_file_context() as f:
+        assert isinstance(f, mmap.mmap)
+        assert f.read(5) == b"%PDF-"
+
+    assert handler.pages == [1]
+    assert not PdfReader(io.BytesIO(handler._split_page(1))).is_encrypted
+
+
+def test_handler_parallel(testdir, monkeypatch):
+    filename = os.path.join(
+        testdir, "tabula/icdar2013-dataset/competition-dataset-eu/eu-004.pdf"
+    )
+    tables = camelot.read_pdf(filename, pages="1-6", flavor="stream")
+
+    # use the process pool even on single cpu machines, and recycle
+    # its workers after every other page
+    monkeypatch.setattr("multiprocessing.cpu_count", lambda: 2)
+    monkeypatch.setattr("camelot.handlers.MAX_PAGES_PER_CHILD", 2)
+    parallel_tables = camelot.read_pdf(
+        filename, pages="1-6", flavor="stream", parallel=True
+    )
+
+    assert [(t.page, t.order) for t in parallel_tables] == [
+        (t.page, t.order) for t in tables
+    ]
+    for table, parallel_table in zip(tables, parallel_tables):
+        assert_frame_equal(table.df, parallel_table.df)
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="gc is only frozen for fork"
+)
+def test_handler_parallel_keeps_gc_freeze(testdir, monkeypatch):
+    filename = os.path.join(
+        testdir, "tabula/icdar2013-dataset/competition-dataset-eu/eu-004.pdf"
+    )
+    monkeypatch.setattr("multiprocessing.cpu_count", lambda: 2)
+
+    gc.freeze()
+    try:
+        frozen = gc.get_freeze_count()
+        camelot.read_pdf(filename, pages="1-2", flavor="stream", parallel=True)
+        assert gc.get_freeze_count() == frozen
+    finally:
+        gc.unfreeze()
+
+    camelot.read_pdf(filename, pages="1-2", flavor="stream", parallel=True)
+    assert gc.get_freeze_count() == 0
+
+
+def test_handler_with_unseekable_stream(testdir):
+    filename = os.path.join(testdir, "foo.pdf")
+
+    def write(write_fd):
+        with open(filename, "rb") as f, open(write_fd, "wb") as w:
+            w.write(f.read())
+
+    read_fd, write_fd = os.pipe()
+    writer = threading.Thread(target=write, args=(write_fd,))
+    writer.start()
+    with open(read_fd, "rb") as r:
+        assert not r.seekable()
+        handler = PDFHandler(r, pages="all")
+    writer.join()
+    assert handler.pages == [1]
+
+
+def test_handler_parser_without_rotation_fix(testdir, monkeypatch):
+    class NoRotationStream(Stream):
+        needs_rotation_fix = False
+
+    def fail(*args, **kwargs):
+        pytest.fail("rotation check ran for a parser that opted out")
+
+    monkeypatch.setitem(PARSERS, "stream", NoRotationStream)
+    monkeypatch.setattr(PDFHandler, "_fix_rotation", fail)
+    monkeypatch.setattr("camelot.handlers.get_page_layout", fail)
+
+    filename = os.path.join(testdir, "anticlockwise_table_2.pdf")
+    tables = PDFHandler(filename).parse(flavor="stream")
+    assert tables.n == 1
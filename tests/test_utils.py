@@ -10,6 +10,9 @@ from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
 from pdfminer.pdfpage import PDFPage
 
 from camelot.utils import bbox_intersection_area
+from camelot.utils import get_page_layout
+from camelot.utils import get_text_objects
+from camelot.utils import get_text_objects_multi
 
 
 def get_text_from_pdf(filename):
@@ -43,3 +46,24 @@ def test_bbox_intersection_text(testdir):
     pdftextelement2 = get_text_from_pdf(filename2)
 
     assert bbox_intersection_area(pdftextelement1, pdftextelement2) == 0.0
+
+
+def test_get_page_layout_file_like(testdir):
+    filename = os.path.join(testdir, "foo.pdf")
+    layout, dim = get_page_layout(filename)
+
+    with open(filename, "rb") as f:
+        layout_f, dim_f = get_page_layout(f)
+
+    assert dim_f == dim
+    assert len(layout_f._objs) == len(layout._objs)
+
+
+def test_get_text_objects_multi(testdir):
+    filename = os.path.join(testdir, "anticlockwise_table_2.pdf")
+    layout, dim = get_page_layout(filename)
+    ltypes = ("char", "image", "horizontal_text", "vertical_text")
+
+    objs = get_text_objects_multi(layout, ltypes=ltypes)
+    for ltype in ltypes:
+        assert objs[ltype] == get_text_objects(layout, ltype=ltype)